@@ -10,15 +10,8 @@ from generator import load_instructions, load_csrs, parse_match, signed
 
 logging.basicConfig(level=logging.INFO, format="%(levelname)s:: %(message)s")
 
-
-def make_go(instr_dict, csrs, output_file="inst.go"):
-    """
-    Generate a Go source file with the instruction encodings followed by
-    a map of CSR names and addresses.
-    """
-    args = " ".join(sys.argv)
-    prelude = f"// Code generated by {args}; DO NOT EDIT.\n"
-    prelude += """package riscv
+# Static Go boilerplate shared by every generated file
+_GO_PRELUDE = """package riscv
 
 import "cmd/internal/obj"
 
@@ -35,7 +28,23 @@ func encode(a obj.As) *inst {
 	switch a {
 """
 
-    instr_str = ""
+_GO_INSTRUCTIONS_END = """  }
+	return nil
+}
+"""
+
+
+def make_go(instr_dict, csrs, output_file="inst.go"):
+    """
+    Generate a Go source file with the instruction encodings followed by
+    a map of CSR names and addresses.
+    """
+    args = " ".join(sys.argv)
+    prelude = f"// Code generated by {args}; DO NOT EDIT.\n" + _GO_PRELUDE
+
+    # Build the output in a list and join once; += re-copies the whole
+    # string on every instruction
+    instr_parts = []
     # Process instructions in sorted order (by name)
     for name, info in sorted(instr_dict.items(), key=lambda x: x[0].upper()):
         match_str = info["match"]
@@ -48,26 +57,28 @@ func encode(a obj.As) *inst {
         funct7 = (enc_match >> 25) & ((1 << 7) - 1)
         # Create the instruction case name. For example, "bclri" becomes "ABCLRI"
         instr_case = f"A{name.upper().replace('.','')}"
-        instr_str += f"""  case {instr_case}:
+        instr_parts.append(
+            f"""  case {instr_case}:
     return &inst{{ {hex(opcode)}, {hex(funct3)}, {hex(rs1)}, {hex(rs2)}, {signed(csr_val,12)}, {hex(funct7)} }}
 """
-    instructions_end = """  }
-	return nil
-}
-"""
+        )
 
     # Build the CSR map block - now matching the second script's format
-    csrs_map_str = "var csrs = map[uint16]string {\n"
-    # Convert the dictionary to a list of tuples and sort by address
-    csr_items = [(int(addr), name.upper()) for addr, name in csrs.items()]
-    for addr, name in sorted(csr_items, key=lambda x: x[0]):
-        csrs_map_str += f'{hex(addr)} : "{name}",\n'
-    csrs_map_str += "}\n"
-
-    go_code = prelude + instr_str + instructions_end + "\n" + csrs_map_str
-
-    with open(output_file, "w", encoding="utf-8") as f:
-        f.write(go_code)
+    csr_parts = ["var csrs = map[uint16]string {\n"]
+    # load_csrs already keys by integer address and uppercases the names, so
+    # sort the dict directly instead of materializing a converted tuple list
+    for addr in sorted(csrs):
+        csr_parts.append(f'{hex(addr)} : "{csrs[addr].upper()}",\n')
+    csr_parts.append("}\n")
+
+    # Stream the sections through one buffered handle instead of joining
+    # them into a single large string first
+    with open(output_file, "w", encoding="utf-8", buffering=1 << 20) as f:
+        f.write(prelude)
+        f.writelines(instr_parts)
+        f.write(_GO_INSTRUCTIONS_END)
+        f.write("\n")
+        f.writelines(csr_parts)
     logging.info(
         f"Generated {output_file} with {len(instr_dict)} instructions and {len(csrs)} CSRs"
     )
@@ -143,10 +154,14 @@ def main():
     if not os.path.isdir(args.csr_dir):
         logging.warning(f"CSR directory not found: {args.csr_dir}")
 
-    # Load instructions filtered by extensions or all instructions
+    # Load instructions and CSRs sequentially: each load fans out on its own
+    # process pool, and forking those pools from concurrent threads risks a
+    # child inheriting a held logging lock
     instr_dict = load_instructions(
         args.inst_dir, enabled_extensions, include_all, args.arch
     )
+    csrs = load_csrs(args.csr_dir, enabled_extensions, include_all, args.arch)
+
     if not instr_dict:
         logging.error("No instructions found or all were filtered out.")
         logging.error(
@@ -155,8 +170,6 @@ def main():
         sys.exit(1)
     logging.info(f"Loaded {len(instr_dict)} instructions")
 
-    # Load CSRs filtered by extensions or all CSRs
-    csrs = load_csrs(args.csr_dir, enabled_extensions, include_all, args.arch)
     if not csrs:
         logging.warning("No CSRs found or all were filtered out.")
     else:
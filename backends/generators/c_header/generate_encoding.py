@@ -3,7 +3,9 @@
 Generator script for C encoding header.
 This script uses the existing generator.py functions to create encoding.h.
 """
+import functools
 import os
+import re
 import sys
 import logging
 import argparse
@@ -18,21 +20,118 @@ from generator import (
     load_instructions,
     load_csrs,
     load_exception_codes,
-    parse_match,
-    parse_extension_requirements,
 )
 
 logging.basicConfig(level=logging.INFO, format="%(levelname)s:: %(message)s")
 
 
+# Fixed bits ('0'/'1') map to '1', variable bits ('-') to '0'
+_MASK_TRANS = str.maketrans({"0": "1", "1": "1", "-": "0"})
+
+# Name-transform tables: dots become underscores, with optional ASCII case
+# folding, in one C-level pass instead of chained .upper()/.replace() calls
+_UPPER_DOT_US = str.maketrans(
+    {".": "_", **{chr(c): chr(c - 32) for c in range(ord("a"), ord("z") + 1)}}
+)
+_LOWER_DOT_US = str.maketrans(
+    {".": "_", **{chr(c): chr(c + 32) for c in range(ord("A"), ord("Z") + 1)}}
+)
+_DOT_US = str.maketrans({".": "_"})
+
+# Field-name sanitization in one pass (maketrans values may be strings, so
+# '=' can expand to '_eq_')
+_FIELD_SANITIZE = str.maketrans({" ": "_", "=": "_eq_"})
+
+
 def calculate_mask(match_str):
     """Convert the bit pattern string to a mask (1 for fixed bits, 0 for variable bits)."""
-    return int("".join("0" if c == "-" else "1" for c in match_str), 2)
+    return int(match_str.translate(_MASK_TRANS), 2)
+
+
+# Predefined common field positions
+_COMMON_FIELDS = {
+    "opcode": (6, 0),
+    "rd": (11, 7),
+    "rs1": (19, 15),
+    "rs2": (24, 20),
+    "rs3": (31, 27),
+    "funct3": (14, 12),
+    "funct5": (31, 27),
+    "funct7": (31, 25),
+    "imm_i": (31, 20),
+    "imm_s": (31, 25),
+    "imm_b": (31, 25),
+    "imm_u": (31, 12),
+    "imm_j": (31, 12),
+    "zimm": (19, 15),
+    "pred": (27, 24),
+    "succ": (23, 20),
+    "rm": (14, 12),
+    "csr": (31, 20),
+}
+
+# The common-field defines are literal constants, so emit their finished
+# #define lines once at import time
+_COMMON_FIELD_LINES = {
+    name: (
+        f"#define INSN_FIELD_{name.upper()} "
+        f"0x{((1 << (high - low + 1)) - 1) << low:x}  /* {high}-{low} */\n"
+    )
+    for name, (high, low) in _COMMON_FIELDS.items()
+}
+
+
+# Bytes-level translation tables: variable bits ('-') clear for the match
+# value, fixed bits set for the mask
+_TO01_MATCH = bytes.maketrans(b"-", b"0")
+_TO01_MASK = bytes.maketrans(b"01-", b"110")
+
+
+@functools.lru_cache(maxsize=None)
+def _match_mask(match_str):
+    """Compute the (match, mask) integer pair for a bitpattern, cached so
+    instructions sharing an encoding pattern pay for one pass.
+
+    The pattern is encoded once and both integers come from bytes.translate
+    plus int(..., 2) — all C-level, no per-character Python work.
+    """
+    b = match_str.encode("ascii")
+    return int(b.translate(_TO01_MATCH), 2), int(b.translate(_TO01_MASK), 2)
+
+
+_LOC_RE = re.compile(r"(\d+)(?:-(\d+))?")
+
+
+@functools.lru_cache(maxsize=None)
+def _location_entry(location_str):
+    """Resolve a location string to its (location, mask) strings.
+
+    Returns None for malformed locations. The same few location strings
+    recur across thousands of instruction variables, so results are
+    memoized.
+    """
+    m = _LOC_RE.fullmatch(location_str)
+    if m is None:
+        return None
+    high = int(m.group(1))
+    if m.group(2) is None:
+        return str(high), f"0x{1 << high:x}"
+    low = int(m.group(2))
+    if low > high:
+        return None
+    mask = ((1 << (high - low + 1)) - 1) << low
+    return f"{high}-{low}", f"0x{mask:x}"
 
 
 def extract_instruction_fields(instructions):
-    """Extract field names and their positions from instruction definitions."""
-    field_dict = {}
+    """Extract instruction fields and format their #define lines.
+
+    Formatting is fused into the extraction pass: the returned dict maps
+    each field name directly to its finished INSN_FIELD line, so no
+    intermediate per-field records are materialized.
+    """
+    # Start from the precomputed common entries
+    field_dict = dict(_COMMON_FIELD_LINES)
 
     # Define standard field name mapping (architecture-specific to standard)
     field_name_map = {
@@ -62,55 +161,22 @@ def extract_instruction_fields(instructions):
         "rm": "rm",
     }
 
-    # Predefined common field positions
-    common_fields = {
-        "opcode": (6, 0),
-        "rd": (11, 7),
-        "rs1": (19, 15),
-        "rs2": (24, 20),
-        "rs3": (31, 27),
-        "funct3": (14, 12),
-        "funct5": (31, 27),
-        "funct7": (31, 25),
-        "imm_i": (31, 20),
-        "imm_s": (31, 25),
-        "imm_b": (31, 25),
-        "imm_u": (31, 12),
-        "imm_j": (31, 12),
-        "zimm": (19, 15),
-        "pred": (27, 24),
-        "succ": (23, 20),
-        "rm": (14, 12),
-        "csr": (31, 20),
-    }
-
-    # First add all common fields
-    for name, (high, low) in common_fields.items():
-        mask = ((1 << (high - low + 1)) - 1) << low
-        field_dict[name] = {
-            "location": f"{high}-{low}",
-            "mask": f"0x{mask:x}",
-            "source": "common",
-        }
-
     # Then process fields from actual instructions
     for name, instr_data in instructions.items():
-        # Get variables from the instruction structure
-        variables = []
-        if "encoding" in instr_data:
-            encoding = instr_data["encoding"]
-
-            if isinstance(encoding, dict):
-                if "variables" in encoding:
-                    variables = encoding.get("variables", [])
-                elif "RV64" in encoding:
-                    rv64_encoding = encoding.get("RV64", {})
-                    if isinstance(rv64_encoding, dict):
-                        variables = rv64_encoding.get("variables", [])
-                elif "RV32" in encoding:
-                    rv32_encoding = encoding.get("RV32", {})
-                    if isinstance(rv32_encoding, dict):
-                        variables = rv32_encoding.get("variables", [])
+        # Get variables from the instruction structure: directly from the
+        # encoding, or from its RV64 (preferred) / RV32 variant
+        encoding = instr_data.get("encoding")
+        if not isinstance(encoding, dict):
+            continue
+
+        variables = encoding.get("variables")
+        if variables is None:
+            arch_encoding = encoding.get("RV64", encoding.get("RV32"))
+            variables = (
+                arch_encoding.get("variables", [])
+                if isinstance(arch_encoding, dict)
+                else []
+            )
 
         # Process each field
         for var in variables:
@@ -127,49 +193,25 @@ def extract_instruction_fields(instructions):
             std_field_name = field_name_map.get(orig_field_name, orig_field_name)
 
             # Skip if we already have this field from common definitions
-            if (
-                std_field_name in field_dict
-                and field_dict[std_field_name].get("source") == "common"
-            ):
+            if std_field_name in _COMMON_FIELDS:
                 continue
 
-            # Process location format
-            if isinstance(location, str) and "-" in location:
-                try:
-                    high, low = map(int, location.split("-"))
-                    mask = ((1 << (high - low + 1)) - 1) << low
-                    field_dict[std_field_name] = {
-                        "location": f"{high}-{low}",
-                        "mask": f"0x{mask:x}",
-                        "source": "instruction",
-                        "original_name": (
-                            orig_field_name
-                            if orig_field_name != std_field_name
-                            else None
-                        ),
-                    }
-                except ValueError:
-                    logging.warning(
-                        f"Invalid location format: {location} for field {orig_field_name}"
-                    )
-            elif isinstance(location, (int, str)):
-                try:
-                    pos = int(location)
-                    mask = 1 << pos
-                    field_dict[std_field_name] = {
-                        "location": str(pos),
-                        "mask": f"0x{mask:x}",
-                        "source": "instruction",
-                        "original_name": (
-                            orig_field_name
-                            if orig_field_name != std_field_name
-                            else None
-                        ),
-                    }
-                except ValueError:
-                    logging.warning(
-                        f"Invalid location format: {location} for field {orig_field_name}"
-                    )
+            # Process location format via the cached parser
+            entry = _location_entry(str(location))
+            if entry is None:
+                logging.warning(
+                    f"Invalid location format: {location} for field {orig_field_name}"
+                )
+            else:
+                location_str, mask_str = entry
+                comment = location_str
+                if orig_field_name != std_field_name:
+                    comment += f" (from {orig_field_name})"
+                sanitized_name = std_field_name.translate(_FIELD_SANITIZE)
+                field_dict[std_field_name] = (
+                    f"#define INSN_FIELD_{sanitized_name.upper()} "
+                    f"{mask_str}  /* {comment} */\n"
+                )
 
     logging.info(f"Extracted {len(field_dict)} unique instruction field names")
     return field_dict
@@ -233,7 +275,9 @@ def main():
     this_dir = os.path.dirname(os.path.abspath(__file__))
     output_file = os.path.join(this_dir, args.output)
 
-    # Load instructions and CSRs
+    # Load instructions and CSRs sequentially: each load fans out on its own
+    # process pool, and forking those pools from concurrent threads risks a
+    # child inheriting a held logging lock
     logging.info(f"Loading instructions from {args.inst_dir}")
     instructions = load_instructions(
         args.inst_dir, args.extensions, include_all=args.include_all, target_arch="BOTH"
@@ -253,88 +297,94 @@ def main():
         resolved_codes_file=args.resolved_codes,
     )
 
-    # Process instructions and calculate masks
+    # Process instructions and calculate masks; instructions without a
+    # match are skipped up front and the try only wraps the computation
+    # that can actually fail
     instr_dict = {}
     for name, instr_data in instructions.items():
         match_str = instr_data.get("match")
-        if match_str:
-            try:
-                match_val = parse_match(match_str)
-                mask_val = calculate_mask(match_str)
-
-                # Convert .rv32 suffix to _rv32
-                if name.endswith(".rv32"):
-                    name = name[:-5] + "_rv32"
-
-                instr_dict[name] = {
-                    "match": f"0x{match_val:x}",
-                    "mask": f"0x{mask_val:x}",
-                }
-            except Exception as e:
-                logging.error(f"Error processing {name}: {e}")
+        if not match_str:
+            continue
+
+        try:
+            match_val, mask_val = _match_mask(match_str)
+        except Exception as e:
+            logging.error(f"Error processing {name}: {e}")
+            continue
+
+        # Convert .rv32 suffix to _rv32
+        if name.endswith(".rv32"):
+            name = name[:-5] + "_rv32"
+
+        # hex() is a single C call and produces the same 0x form
+        instr_dict[name] = {
+            "match": hex(match_val),
+            "mask": hex(mask_val),
+        }
 
     # Extract field information
     field_dict = extract_instruction_fields(instructions)
 
-    # Generate output strings
-    mask_match_str = ""
+    # Generate output strings; one sorted pass feeds both the MATCH/MASK
+    # defines and the DECLARE_INSN list, with the name transforms computed
+    # once per instruction, and the parts joined once at the end
+    mask_match_parts = []
+    declare_insn_parts = []
     for i in sorted(instr_dict.keys()):
-        mask_match_str += (
-            f'#define MATCH_{i.upper().replace(".","_")} {instr_dict[i]["match"]}\n'
-        )
-        mask_match_str += (
-            f'#define MASK_{i.upper().replace(".","_")} {instr_dict[i]["mask"]}\n'
+        entry = instr_dict[i]
+        name_upper = i.translate(_UPPER_DOT_US)
+        name_us = i.translate(_DOT_US)
+        mask_match_parts.append(f'#define MATCH_{name_upper} {entry["match"]}\n')
+        mask_match_parts.append(f'#define MASK_{name_upper} {entry["mask"]}\n')
+        declare_insn_parts.append(
+            f"DECLARE_INSN({name_us}, MATCH_{name_upper}, MASK_{name_upper})\n"
         )
 
-    declare_insn_str = ""
-    for i in sorted(instr_dict.keys()):
-        declare_insn_str += f'DECLARE_INSN({i.replace(".","_")}, MATCH_{i.upper().replace(".","_")}, MASK_{i.upper().replace(".","_")})\n'
-
-    csr_names_str = ""
-    declare_csr_str = ""
+    csr_names_parts = []
+    declare_csr_parts = []
     for addr, name in sorted(csrs.items()):
-        csr_names_str += f"#define CSR_{name.upper().replace(".","_")} 0x{addr:x}\n"
-        declare_csr_str += f"DECLARE_CSR({name.lower().replace(".","_")}, CSR_{name.upper().replace(".","_")})\n"
+        name_upper = name.translate(_UPPER_DOT_US)
+        name_lower = name.translate(_LOWER_DOT_US)
+        csr_names_parts.append(f"#define CSR_{name_upper} 0x{addr:x}\n")
+        declare_csr_parts.append(f"DECLARE_CSR({name_lower}, CSR_{name_upper})\n")
 
-    causes_str = ""
-    declare_cause_str = ""
+    causes_parts = []
+    declare_cause_parts = []
     for num, name in causes:
         sanitized_name = name.upper()
-        causes_str += f"#define CAUSE_{sanitized_name} 0x{num:x}\n"
-        declare_cause_str += f'DECLARE_CAUSE("{name}", CAUSE_{sanitized_name})\n'
-
-    field_str = ""
-    for field_name, details in sorted(field_dict.items()):
-        sanitized_name = field_name.replace(" ", "_").replace("=", "_eq_")
-        comment = f"{details['location']}"
-        if details.get("original_name"):
-            comment += f" (from {details['original_name']})"
-        field_str += f"#define INSN_FIELD_{sanitized_name.upper()} {details['mask']}  /* {comment} */\n"
-
-    # Assemble final output
-    output_str = f"""/* SPDX-License-Identifier: BSD-3-Clause */
-/* Copyright (c) 2023 RISC-V International */
-/*
- * This file is auto-generated by riscv-unified-db
- */
-
-#ifndef RISCV_ENCODING_H
-#define RISCV_ENCODING_H
-{mask_match_str}
-{csr_names_str}
-{causes_str}
-{field_str}#endif
-#ifdef DECLARE_INSN
-{declare_insn_str}#endif
-#ifdef DECLARE_CSR
-{declare_csr_str}#endif
-#ifdef DECLARE_CAUSE
-{declare_cause_str}#endif
-"""
-
-    # Write output file
-    with open(output_file, "w", encoding="utf-8") as enc_file:
-        enc_file.write(output_str)
+        causes_parts.append(f"#define CAUSE_{sanitized_name} 0x{num:x}\n")
+        declare_cause_parts.append(f'DECLARE_CAUSE("{name}", CAUSE_{sanitized_name})\n')
+
+    field_lines = [line for _, line in sorted(field_dict.items())]
+
+    # Stream each section to the output through one buffered handle
+    # instead of materializing every section string plus their final
+    # concatenation in memory
+    with open(output_file, "w", encoding="utf-8", buffering=1 << 20) as enc_file:
+        enc_file.write(
+            "/* SPDX-License-Identifier: BSD-3-Clause */\n"
+            "/* Copyright (c) 2023 RISC-V International */\n"
+            "/*\n"
+            " * This file is auto-generated by riscv-unified-db\n"
+            " */\n"
+            "\n"
+            "#ifndef RISCV_ENCODING_H\n"
+            "#define RISCV_ENCODING_H\n"
+        )
+        enc_file.writelines(mask_match_parts)
+        enc_file.write("\n")
+        enc_file.writelines(csr_names_parts)
+        enc_file.write("\n")
+        enc_file.writelines(causes_parts)
+        enc_file.write("\n")
+        enc_file.writelines(field_lines)
+        enc_file.write("#endif\n#ifdef DECLARE_INSN\n")
+        enc_file.writelines(declare_insn_parts)
+        enc_file.write("#endif\n#ifdef DECLARE_CSR\n")
+        enc_file.writelines(declare_csr_parts)
+        enc_file.write("#endif\n#ifdef DECLARE_CAUSE\n")
+        enc_file.writelines(declare_cause_parts)
+        enc_file.write("#endif\n")
 
     logging.info(f"Generated encoding header file: {output_file}")
 
@@ -1,13 +1,32 @@
 #!/usr/bin/env python3
+import functools
 import os
+import pickle
 import yaml
 import logging
 import pprint
 import json
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    # Prefer the libyaml C bindings; parsing is several times faster
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+try:
+    # orjson parses severalfold faster than the stdlib; fall back silently
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
 
 pp = pprint.PrettyPrinter(indent=2)
 logging.basicConfig(level=logging.INFO, format="%(levelname)s:: %(message)s")
 
+# Translation table mapping the separators found in exception-code names
+# to identifier-safe underscores; translate() does this in a single C pass
+_NAME_SANITIZE_TABLE = str.maketrans({" ": "_", "/": "_", "-": "_"})
+
 
 def check_requirement(req, exts):
     if isinstance(req, str):
@@ -18,6 +37,22 @@ def check_requirement(req, exts):
     return False
 
 
+@functools.lru_cache(maxsize=None)
+def _opcode_location_high(location):
+    """Highest bit position named by an opcode location like '12|6-2'."""
+    return max(
+        int(part.split("-")[0]) if "-" in part else int(part)
+        for part in location.split("|")
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _location_high_low(location):
+    """(high, low) bit positions of a contiguous 'high-low' location string."""
+    high, low = map(int, location.split("-"))
+    return high, low
+
+
 def build_match_from_format(format_field):
     """
     Build a match string from the format field in the new schema.
@@ -34,17 +69,9 @@ def build_match_from_format(format_field):
         if isinstance(field_data, dict) and "location" in field_data:
             if isinstance(field_data["location"], str):
                 try:
-                    location = field_data["location"]
-                    split_location = location.split("|")
-                    high = max(
-                        (
-                            int(location.split("-")[0])
-                            if "-" in location
-                            else int(location)
-                        )
-                        for location in split_location
+                    valid_locations.append(
+                        _opcode_location_high(field_data["location"])
                     )
-                    valid_locations.append(high)
                 except (ValueError, IndexError):
                     raise ValueError(
                         f"Invalid location format: {field_data['location']}"
@@ -101,7 +128,7 @@ def build_match_from_format(format_field):
             try:
                 location = field_data["location"]
                 if isinstance(location, str) and "-" in location:
-                    high, low = map(int, location.split("-"))
+                    high, low = _location_high_low(location)
                 else:
                     high = low = int(location)
 
@@ -131,9 +158,10 @@ def parse_extension_requirements(extensions_spec):
     if isinstance(extensions_spec, str):
         # Simple case: a single extension
         extension = extensions_spec
-        if extension.startswith("RV"):
-            # Extract the actual extension part from RV prefix
-            if extension.startswith("RV32") or extension.startswith("RV64"):
+        if extension[:2] == "RV":
+            # Extract the actual extension part from the RV prefix; a single
+            # slice comparison avoids re-scanning the prefix three times
+            if extension[2:4] in ("32", "64"):
                 ext_parts = extension[4:]
             else:
                 ext_parts = extension[2:]
@@ -143,53 +171,30 @@ def parse_extension_requirements(extensions_spec):
             )
         return lambda exts: extension in exts
 
-    # Handle complex cases with allOf/oneOf/anyOf
-    if "allOf" in extensions_spec:
-        required = extensions_spec["allOf"]
-        if isinstance(required, str):
-            required = [required]
-
-        # Process each requirement, which could be a string or a dict with name/version
-        return lambda exts: all(check_requirement(req, exts) for req in required)
-
-    if "oneOf" in extensions_spec:
-        alternatives = extensions_spec["oneOf"]
-        if isinstance(alternatives, str):
-            alternatives = [alternatives]
-
-        # Process each alternative, which could be a string or a dict with name/version
-        def check_alternative_one_of(alt, exts):
-            if isinstance(alt, str):
-                return alt in exts
-            elif isinstance(alt, dict) and "name" in alt:
+    # Handle complex cases with allOf/oneOf/anyOf; each entry can be a string,
+    # a dict with name/version, or a nested allOf
+    def check_alternative(alt, exts):
+        if isinstance(alt, str):
+            return alt in exts
+        elif isinstance(alt, dict):
+            if "allOf" in alt:
+                reqs = alt["allOf"]
+                if isinstance(reqs, str):
+                    reqs = [reqs]
+                return all(check_requirement(r, exts) for r in reqs)
+            elif "name" in alt:
                 return alt["name"] in exts
-            return False
+        return False
 
-        return lambda exts: any(
-            check_alternative_one_of(alt, exts) for alt in alternatives
-        )
+    for key, quantifier in (("allOf", all), ("oneOf", any), ("anyOf", any)):
+        if key in extensions_spec:
+            alternatives = extensions_spec[key]
+            if isinstance(alternatives, str):
+                alternatives = [alternatives]
 
-    # Handle anyOf case (most common in the error output)
-    if "anyOf" in extensions_spec:
-        alternatives = extensions_spec["anyOf"]
-        if isinstance(alternatives, str):
-            alternatives = [alternatives]
-
-        # Process each alternative, which could be a string, dict with name/version, or nested allOf
-        def check_alternative(alt, exts):
-            if isinstance(alt, str):
-                return alt in exts
-            elif isinstance(alt, dict):
-                if "allOf" in alt:
-                    reqs = alt["allOf"]
-                    if isinstance(reqs, str):
-                        reqs = [reqs]
-                    return all(check_requirement(r, exts) for r in reqs)
-                elif "name" in alt:
-                    return alt["name"] in exts
-            return False
-
-        return lambda exts: any(check_alternative(alt, exts) for alt in alternatives)
+            return lambda exts: quantifier(
+                check_alternative(alt, exts) for alt in alternatives
+            )
 
     # Handle direct name/version specification
     if "name" in extensions_spec and "version" in extensions_spec:
@@ -204,6 +209,161 @@ def parse_extension_requirements(extensions_spec):
     return lambda exts: True
 
 
+# parse_extension_requirements results keyed by the spec's repr; the same
+# definedBy/excludedBy structures recur across many instructions
+_requirements_cache = {}
+
+
+def _cached_extension_requirements(spec):
+    """Memoized parse_extension_requirements (specs are dicts, so key by repr)."""
+    key = repr(spec)
+    checker = _requirements_cache.get(key)
+    if checker is None:
+        checker = _requirements_cache[key] = parse_extension_requirements(spec)
+    return checker
+
+
+def _parse_one_yaml(path, kind=None):
+    """Parse a single YAML file, returning (path, data) or (path, None) on error.
+
+    When kind is given, files whose leading bytes lack a matching top-level
+    "kind:" entry are rejected without running the YAML parser at all.
+    """
+    try:
+        # One buffered read; the prefilter and the parser share the bytes
+        # instead of seeking back and re-reading through the stream
+        with open(path, "rb") as f:
+            contents = f.read()
+        if kind is not None and f"kind: {kind}".encode() not in contents[:2048]:
+            return path, None
+        return path, yaml.load(contents, Loader=_YamlLoader)
+    except Exception as e:
+        logging.error(f"Error parsing {path}: {e}")
+        return path, None
+
+
+def _iter_yaml_paths(root_dir):
+    """Yield the path of every .yaml file under root_dir.
+
+    Walks with os.scandir directly so file-vs-directory checks reuse the
+    readdir metadata instead of paying a stat syscall per entry; unreadable
+    directories are skipped like os.walk does.
+    """
+    try:
+        entries = os.scandir(root_dir)
+    except OSError:
+        return
+    with entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _iter_yaml_paths(entry.path)
+            elif entry.name.endswith(".yaml"):
+                yield entry.path
+
+
+# Number of files fed to one yaml.load_all call; amortizes loader setup
+_YAML_BATCH_SIZE = 64
+
+
+def _parse_yaml_batch(paths, kind=None):
+    """
+    Parse a batch of YAML files with a single yaml.load_all call over their
+    concatenated bytes, amortizing per-document loader construction. Returns
+    a list of (path, data) pairs. If the concatenated stream does not split
+    into exactly one document per file, the batch falls back to per-file
+    parsing so error reporting and results match the unbatched path.
+    """
+    kept = []
+    blobs = []
+    marker = f"kind: {kind}".encode() if kind is not None else None
+    for path in paths:
+        try:
+            with open(path, "rb") as f:
+                contents = f.read()
+        except OSError as e:
+            logging.error(f"Error parsing {path}: {e}")
+            continue
+        if marker is not None and marker not in contents[:2048]:
+            continue
+        # Drop a leading bare document-marker line so the separators below
+        # stay in one-to-one correspondence with files; a marker with content
+        # on the same line is left alone (the count check below catches it)
+        if contents.startswith((b"---\n", b"---\r\n")):
+            contents = contents.split(b"\n", 1)[1]
+        kept.append(path)
+        blobs.append(contents)
+
+    try:
+        parsed = list(yaml.load_all(b"\n---\n".join(blobs), Loader=_YamlLoader))
+    except Exception:
+        parsed = None
+    if parsed is not None and len(parsed) == len(kept):
+        return list(zip(kept, parsed))
+
+    return [_parse_one_yaml(path, kind=kind) for path in kept]
+
+
+def _load_yaml_tree(root_dir, kind=None):
+    """
+    Parse every .yaml file under root_dir and return (found_files, docs) where
+    docs maps each file path to its parsed content (files that fail to parse
+    are logged and omitted). When kind is given, files of any other kind are
+    skipped with a cheap byte scan before the parser runs.
+
+    Parsed results are cached in a pickle sidecar (<root_dir>/.udb_yaml_cache.pkl)
+    keyed by every file's (mtime_ns, size), so unchanged trees skip the YAML
+    walk entirely on warm runs. Set UDB_DISABLE_YAML_CACHE to bypass the cache.
+    """
+    paths = sorted(_iter_yaml_paths(root_dir))
+
+    signature = {}
+    for path in paths:
+        st = os.stat(path)
+        signature[path] = [st.st_mtime_ns, st.st_size]
+
+    use_cache = not os.environ.get("UDB_DISABLE_YAML_CACHE")
+    cache_path = os.path.join(root_dir, ".udb_yaml_cache.pkl")
+    if use_cache and os.path.exists(cache_path):
+        try:
+            with open(cache_path, "rb") as f:
+                cached = pickle.load(f)
+            if cached.get("signature") == signature and cached.get("kind") == kind:
+                return len(paths), cached["docs"]
+        except Exception as e:
+            logging.debug(f"Ignoring unreadable YAML cache {cache_path}: {e}")
+
+    # Parsing is CPU-bound and independent per file, so fan out across
+    # cores; below ~50 files the pool spin-up costs more than it saves
+    batches = [
+        paths[i : i + _YAML_BATCH_SIZE] for i in range(0, len(paths), _YAML_BATCH_SIZE)
+    ]
+    parse = functools.partial(_parse_yaml_batch, kind=kind)
+    if len(paths) < 50:
+        batch_results = map(parse, batches)
+    else:
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+            batch_results = list(executor.map(parse, batches))
+
+    docs = {}
+    for batch in batch_results:
+        for path, data in batch:
+            if data is not None:
+                docs[path] = data
+
+    if use_cache:
+        try:
+            with open(cache_path, "wb") as f:
+                pickle.dump(
+                    {"signature": signature, "kind": kind, "docs": docs},
+                    f,
+                    protocol=pickle.HIGHEST_PROTOCOL,
+                )
+        except Exception as e:
+            logging.debug(f"Could not write YAML cache {cache_path}: {e}")
+
+    return len(paths), docs
+
+
 def load_instructions(
     root_dir, enabled_extensions, include_all=False, target_arch="RV64"
 ):
@@ -224,162 +384,157 @@ def load_instructions(
         f"Searching for instruction files in {root_dir} for target architecture {target_arch}"
     )
 
-    for dirpath, _, filenames in os.walk(root_dir):
-        for fname in filenames:
-            if not fname.endswith(".yaml"):
-                continue
-            found_files += 1
-            path = os.path.join(dirpath, fname)
-            try:
-                with open(path, encoding="utf-8") as f:
-                    data = yaml.safe_load(f)
-            except Exception as e:
-                logging.error(f"Error parsing {path}: {e}")
-                continue
-
-            if data.get("kind") != "instruction":
+    # Precomputed arch-admission flags; checked once here instead of via
+    # list membership for every instruction
+    rv32_ok = target_arch in ("RV32", "BOTH")
+    rv64_ok = target_arch in ("RV64", "BOTH")
+    want_both = target_arch == "BOTH"
+
+    found_files, docs = _load_yaml_tree(root_dir, kind="instruction")
+    for path, data in docs.items():
+        if data.get("kind") != "instruction":
+            continue
+
+        found_instructions += 1
+        name = data.get("name")
+        if not name:
+            logging.error(f"Missing 'name' field in {path}")
+            continue
+
+        # If include_all is True, skip extension filtering
+        if not include_all:
+            # Check if this instruction is defined by an enabled extension
+            definedBy = data.get("definedBy")
+            if definedBy is None:
+                logging.error(
+                    f"Missing 'definedBy' field in instruction {name} in {path}"
+                )
+                extension_filtered += 1
                 continue
 
-            found_instructions += 1
-            name = data.get("name")
-            if not name:
-                logging.error(f"Missing 'name' field in {path}")
+            logging.debug(f"Instruction {name} definedBy: {definedBy}")
+            meets_extension_req = _cached_extension_requirements(definedBy)
+            if not meets_extension_req(enabled_extensions):
+                msg = f"Skipping {name} because its extension is not enabled"
+                logging.debug(msg)
+                extension_filtered += 1
                 continue
 
-            # If include_all is True, skip extension filtering
-            if not include_all:
-                # Check if this instruction is defined by an enabled extension
-                definedBy = data.get("definedBy")
-                if definedBy is None:
-                    logging.error(
-                        f"Missing 'definedBy' field in instruction {name} in {path}"
+            # Check if this instruction is excluded by an enabled extension
+            excludedBy = data.get("excludedBy")
+            if excludedBy:
+                exclusion_check = _cached_extension_requirements(excludedBy)
+                if exclusion_check(enabled_extensions):
+                    msg = (
+                        f"Skipping {name} because it's excluded by an enabled extension"
                     )
-                    extension_filtered += 1
-                    continue
-
-                logging.debug(f"Instruction {name} definedBy: {definedBy}")
-                meets_extension_req = parse_extension_requirements(definedBy)
-                if not meets_extension_req(enabled_extensions):
-                    msg = f"Skipping {name} because its extension is not enabled"
                     logging.debug(msg)
                     extension_filtered += 1
                     continue
 
-                # Check if this instruction is excluded by an enabled extension
-                excludedBy = data.get("excludedBy")
-                if excludedBy:
-                    exclusion_check = parse_extension_requirements(excludedBy)
-                    if exclusion_check(enabled_extensions):
-                        msg = f"Skipping {name} because it's excluded by an enabled extension"
-                        logging.debug(msg)
-                        extension_filtered += 1
-                        continue
-
-            encoding = data.get("encoding", {})
-            if not encoding:
-                # Check if this instruction uses the new schema with a 'format' field
-                format_field = data.get("format")
-                if not format_field:
-                    logging.error(
-                        f"Missing 'encoding' field in instruction {name} in {path}"
-                    )
-                    encoding_filtered += 1
-                    continue
+        encoding = data.get("encoding", {})
+        if not encoding:
+            # Check if this instruction uses the new schema with a 'format' field
+            format_field = data.get("format")
+            if not format_field:
+                logging.error(
+                    f"Missing 'encoding' field in instruction {name} in {path}"
+                )
+                encoding_filtered += 1
+                continue
 
-                # Try to build a match string from the format field
-                match_string = build_match_from_format(format_field)
-                if not match_string:
-                    logging.error(
-                        f"Could not build encoding from format field in instruction {name} in {path}"
-                    )
-                    encoding_filtered += 1
-                    continue
+            # Try to build a match string from the format field
+            match_string = build_match_from_format(format_field)
+            if not match_string:
+                logging.error(
+                    f"Could not build encoding from format field in instruction {name} in {path}"
+                )
+                encoding_filtered += 1
+                continue
 
-                # Create a synthetic encoding compatible with existing logic
-                encoding = {"match": match_string, "variables": []}
-                logging.debug(f"Built encoding from format field for {name}")
-
-            # Check if the instruction specifies a base architecture constraint
-            base = data.get("base")
-            if base is not None:
-                if (base == 32 and target_arch not in ["RV32", "BOTH"]) or (
-                    base == 64 and target_arch not in ["RV64", "BOTH"]
-                ):
-                    msg = f"Skipping {name} because it requires base {base} which doesn't match target arch {target_arch}"
+            # Create a synthetic encoding compatible with existing logic
+            encoding = {"match": match_string, "variables": []}
+            logging.debug(f"Built encoding from format field for {name}")
+
+        # Check if the instruction specifies a base architecture constraint
+        base = data.get("base")
+        if base is not None:
+            if (base == 32 and not rv32_ok) or (base == 64 and not rv64_ok):
+                msg = f"Skipping {name} because it requires base {base} which doesn't match target arch {target_arch}"
+                logging.debug(msg)
+                encoding_filtered += 1
+                continue
+
+        # Determine which encoding to use based on target architecture
+        if isinstance(encoding, dict):
+            if "RV64" in encoding and "RV32" in encoding:
+                # Instruction has both RV32 and RV64 encodings
+                if target_arch == "RV64":
+                    encoding_to_use = encoding["RV64"]
+                    instr_key = name
+                elif target_arch == "RV32":
+                    encoding_to_use = encoding["RV32"]
+                    instr_key = name
+                else:  # BOTH
+                    # For "BOTH", include both encodings with suitable naming
+                    rv64_encoding = encoding["RV64"]
+                    rv32_encoding = encoding["RV32"]
+
+                    # Process RV64 encoding
+                    rv64_match = rv64_encoding.get("match")
+                    rv32_match = rv32_encoding.get("match")
+
+                    if rv64_match:
+                        instr_dict[name] = {
+                            "match": rv64_match
+                        }  # RV64 gets the default name
+
+                    if rv32_match and rv32_match != rv64_match:
+                        # Process RV32 encoding with a _rv32 suffix
+                        instr_dict[f"{name}_rv32"] = {"match": rv32_match}
+
+                    continue  # Skip the rest of the loop as we've already added the encodings
+            elif "RV64" in encoding:
+                if rv64_ok:
+                    encoding_to_use = encoding["RV64"]
+                    instr_key = name
+                else:
+                    msg = f"Skipping {name} because it has only RV64 encoding in {path}"
                     logging.debug(msg)
                     encoding_filtered += 1
                     continue
-
-            # Determine which encoding to use based on target architecture
-            if isinstance(encoding, dict):
-                if "RV64" in encoding and "RV32" in encoding:
-                    # Instruction has both RV32 and RV64 encodings
-                    if target_arch == "RV64":
-                        encoding_to_use = encoding["RV64"]
-                        instr_key = name
-                    elif target_arch == "RV32":
-                        encoding_to_use = encoding["RV32"]
-                        instr_key = name
-                    else:  # BOTH
-                        # For "BOTH", include both encodings with suitable naming
-                        rv64_encoding = encoding["RV64"]
-                        rv32_encoding = encoding["RV32"]
-
-                        # Process RV64 encoding
-                        rv64_match = rv64_encoding.get("match")
-                        rv32_match = rv32_encoding.get("match")
-
-                        if rv64_match:
-                            instr_dict[name] = {
-                                "match": rv64_match
-                            }  # RV64 gets the default name
-
-                        if rv32_match and rv32_match != rv64_match:
-                            # Process RV32 encoding with a _rv32 suffix
-                            instr_dict[f"{name}_rv32"] = {"match": rv32_match}
-
-                        continue  # Skip the rest of the loop as we've already added the encodings
-                elif "RV64" in encoding:
-                    if target_arch in ["RV64", "BOTH"]:
-                        encoding_to_use = encoding["RV64"]
-                        instr_key = name
-                    else:
-                        msg = f"Skipping {name} because it has only RV64 encoding in {path}"
-                        logging.debug(msg)
-                        encoding_filtered += 1
-                        continue
-                elif "RV32" in encoding:
-                    if target_arch in ["RV32", "BOTH"]:
-                        encoding_to_use = encoding["RV32"]
-                        instr_key = f"{name}_rv32" if target_arch == "BOTH" else name
-                    else:
-                        msg = f"Skipping {name} because it has only RV32 encoding in {path}"
-                        logging.debug(msg)
-                        encoding_filtered += 1
-                        continue
-                elif "match" in encoding:
-                    # Generic encoding, no specific architecture
-                    encoding_to_use = encoding
-                    instr_key = name
+            elif "RV32" in encoding:
+                if rv32_ok:
+                    encoding_to_use = encoding["RV32"]
+                    instr_key = f"{name}_rv32" if want_both else name
                 else:
-                    msg = f"Skipping {name} because its encoding in {path} has no recognized match field."
-                    logging.warning(msg)
+                    msg = f"Skipping {name} because it has only RV32 encoding in {path}"
+                    logging.debug(msg)
                     encoding_filtered += 1
                     continue
+            elif "match" in encoding:
+                # Generic encoding, no specific architecture
+                encoding_to_use = encoding
+                instr_key = name
             else:
-                msg = f"Skipping {name} because its encoding in {path} is not a dictionary."
+                msg = f"Skipping {name} because its encoding in {path} has no recognized match field."
                 logging.warning(msg)
                 encoding_filtered += 1
                 continue
+        else:
+            msg = f"Skipping {name} because its encoding in {path} is not a dictionary."
+            logging.warning(msg)
+            encoding_filtered += 1
+            continue
 
-            match_str = encoding_to_use.get("match")
-            if not match_str:
-                msg = f"Skipping {name} because 'match' field is missing in {path}"
-                logging.warning(msg)
-                encoding_filtered += 1
-                continue
+        match_str = encoding_to_use.get("match")
+        if not match_str:
+            msg = f"Skipping {name} because 'match' field is missing in {path}"
+            logging.warning(msg)
+            encoding_filtered += 1
+            continue
 
-            instr_dict[instr_key] = {"match": match_str}
+        instr_dict[instr_key] = {"match": match_str}
 
     if found_instructions > 0:
         logging.info(
@@ -418,86 +573,77 @@ def load_csrs(csr_root, enabled_extensions, include_all=False, target_arch="RV64
         f"Searching for CSR files in {csr_root} for target architecture {target_arch}"
     )
 
-    for dirpath, _, filenames in os.walk(csr_root):
-        for fname in filenames:
-            if not fname.endswith(".yaml"):
-                continue
-            found_files += 1
-            path = os.path.join(dirpath, fname)
-            try:
-                with open(path, encoding="utf-8") as f:
-                    data = yaml.safe_load(f)
-            except Exception as e:
-                logging.error(f"Error parsing CSR file {path}: {e}")
-                continue
+    # Precomputed arch-admission flags, as in load_instructions
+    rv32_ok = target_arch in ("RV32", "BOTH")
+    rv64_ok = target_arch in ("RV64", "BOTH")
 
-            if data.get("kind") != "csr":
-                continue
+    found_files, docs = _load_yaml_tree(csr_root, kind="csr")
+    for path, data in docs.items():
+        if data.get("kind") != "csr":
+            continue
 
-            found_csrs += 1
-            name = data.get("name")
-            if not name:
-                logging.error(f"Missing 'name' field in {path}")
-                continue
+        found_csrs += 1
+        name = data.get("name")
+        if not name:
+            logging.error(f"Missing 'name' field in {path}")
+            continue
 
-            address = data.get("address")
-            indirect_address = data.get("indirect_address")
+        address = data.get("address")
+        indirect_address = data.get("indirect_address")
 
-            if not address and not indirect_address:
-                logging.error(
-                    f"Missing 'address' or 'indirect_address' field in CSR {name} in {path}"
-                )
-                address_errors += 1
+        if not address and not indirect_address:
+            logging.error(
+                f"Missing 'address' or 'indirect_address' field in CSR {name} in {path}"
+            )
+            address_errors += 1
+            continue
+
+        # Check if the CSR has a base constraint (32 or 64)
+        base = data.get("base")
+        if base:
+            if base == 32 and not rv32_ok:
+                logging.debug(f"Skipping CSR {name} because it requires RV32 base")
+                arch_filtered += 1
+                continue
+            elif base == 64 and not rv64_ok:
+                logging.debug(f"Skipping CSR {name} because it requires RV64 base")
+                arch_filtered += 1
                 continue
 
-            # Check if the CSR has a base constraint (32 or 64)
-            base = data.get("base")
-            if base:
-                if base == 32 and target_arch not in ["RV32", "BOTH"]:
-                    logging.debug(f"Skipping CSR {name} because it requires RV32 base")
-                    arch_filtered += 1
-                    continue
-                elif base == 64 and target_arch not in ["RV64", "BOTH"]:
-                    logging.debug(f"Skipping CSR {name} because it requires RV64 base")
-                    arch_filtered += 1
-                    continue
-
-            # If include_all is True, skip extension filtering
-            if not include_all:
-                # Check if this CSR is defined by an enabled extension
-                definedBy = data.get("definedBy")
+        # If include_all is True, skip extension filtering
+        if not include_all:
+            # Check if this CSR is defined by an enabled extension
+            definedBy = data.get("definedBy")
 
-                # If definedBy is missing, log a warning but don't skip
-                # This is different from instructions where we're more strict
-                if definedBy is None:
-                    logging.warning(
-                        f"Missing 'definedBy' field in CSR {name} in {path}, including anyway"
-                    )
-                else:
-                    logging.debug(f"CSR {name} definedBy: {definedBy}")
-                    meets_extension_req = parse_extension_requirements(definedBy)
-                    if not meets_extension_req(enabled_extensions):
-                        msg = (
-                            f"Skipping CSR {name} because its extension is not enabled"
-                        )
-                        logging.debug(msg)
-                        extension_filtered += 1
-                        continue
+            # If definedBy is missing, log a warning but don't skip
+            # This is different from instructions where we're more strict
+            if definedBy is None:
+                logging.warning(
+                    f"Missing 'definedBy' field in CSR {name} in {path}, including anyway"
+                )
+            else:
+                logging.debug(f"CSR {name} definedBy: {definedBy}")
+                meets_extension_req = _cached_extension_requirements(definedBy)
+                if not meets_extension_req(enabled_extensions):
+                    msg = f"Skipping CSR {name} because its extension is not enabled"
+                    logging.debug(msg)
+                    extension_filtered += 1
+                    continue
 
-            # If we're here, we've passed all checks
-            try:
-                # Use address if available, otherwise use indirect_address
-                addr_to_use = address if address is not None else indirect_address
-                if isinstance(addr_to_use, int):
-                    addr_int = addr_to_use
-                else:
-                    addr_int = int(addr_to_use, 0)
+        # If we're here, we've passed all checks
+        try:
+            # Use address if available, otherwise use indirect_address
+            addr_to_use = address if address is not None else indirect_address
+            if isinstance(addr_to_use, int):
+                addr_int = addr_to_use
+            else:
+                addr_int = int(addr_to_use, 0)
 
-                csrs[addr_int] = name.upper()
-            except Exception as e:
-                logging.error(f"Error parsing address {addr_to_use} in {path}: {e}")
-                address_errors += 1
-                continue
+            csrs[addr_int] = name.upper()
+        except Exception as e:
+            logging.error(f"Error parsing address {addr_to_use} in {path}: {e}")
+            address_errors += 1
+            continue
 
     if found_csrs > 0:
         logging.info(f"Found {found_csrs} CSR definitions in {found_files} files")
@@ -520,7 +666,9 @@ def load_exception_codes(
     ext_dir, enabled_extensions=None, include_all=False, resolved_codes_file=None
 ):
     """Load exception codes from extension YAML files or pre-resolved JSON file."""
-    exception_codes = []
+    # Keyed by code number; setdefault keeps the first name seen, matching
+    # the old stable sort-then-scan deduplication
+    exception_codes = {}
     found_extensions = 0
     found_files = 0
 
@@ -529,34 +677,21 @@ def load_exception_codes(
     # If we have a resolved codes file, use it instead of processing YAML files
     if resolved_codes_file and os.path.exists(resolved_codes_file):
         try:
-            with open(resolved_codes_file, encoding="utf-8") as f:
-                resolved_codes = json.load(f)
+            with open(resolved_codes_file, "rb") as f:
+                resolved_codes = _json_loads(f.read())
 
             for code in resolved_codes:
                 num = code.get("num")
                 name = code.get("name")
                 if num is not None and name is not None:
-                    sanitized_name = (
-                        name.lower()
-                        .replace(" ", "_")
-                        .replace("/", "_")
-                        .replace("-", "_")
-                    )
-                    exception_codes.append((num, sanitized_name))
+                    sanitized_name = name.lower().translate(_NAME_SANITIZE_TABLE)
+                    exception_codes.setdefault(num, sanitized_name)
 
             logging.info(
                 f"Loaded {len(exception_codes)} pre-resolved exception codes from {resolved_codes_file}"
             )
 
-            # Sort by exception code number and deduplicate
-            seen_nums = set()
-            unique_codes = []
-            for num, name in sorted(exception_codes, key=lambda x: x[0]):
-                if num not in seen_nums:
-                    seen_nums.add(num)
-                    unique_codes.append((num, name))
-
-            return unique_codes
+            return sorted(exception_codes.items())
 
         except Exception as e:
             logging.error(
@@ -564,8 +699,8 @@ def load_exception_codes(
             )
     # Logging an error and skipping the exception cause generation if no resolved codes file found
     else:
-        logging.error(f"Error loading resolved codes file {resolved_codes_file}: {e}")
-        return
+        logging.error(f"Resolved codes file not found: {resolved_codes_file}")
+        return []
 
     if found_extensions > 0:
         logging.info(
@@ -575,15 +710,7 @@ def load_exception_codes(
     else:
         logging.warning(f"No extension definitions found in {ext_dir}")
 
-    # Sort by exception code number and deduplicate
-    seen_nums = set()
-    unique_codes = []
-    for num, name in sorted(exception_codes, key=lambda x: x[0]):
-        if num not in seen_nums:
-            seen_nums.add(num)
-            unique_codes.append((num, name))
-
-    return unique_codes
+    return sorted(exception_codes.items())
 
 
 def parse_match(match_str):
@@ -591,8 +718,7 @@ def parse_match(match_str):
     Convert the bit pattern string to an integer.
     Replace all '-' (variable bits) with '0' so that only constant bits are set.
     """
-    binary_str = "".join("0" if c == "-" else c for c in match_str)
-    return int(binary_str, 2)
+    return int(match_str.replace("-", "0"), 2)
 
 
 # Returns signed interpretation of a value within a given width.
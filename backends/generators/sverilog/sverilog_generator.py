@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 
 import argparse
+import functools
 import os
 import sys
 import logging
@@ -64,24 +65,37 @@ def parse_args():
     return parser.parse_args()
 
 
+# Single-pass translation table shared by the name formatters
+_SV_NAME_TABLE = str.maketrans({".": "_"})
+
+
 def format_instruction_name(name):
     """Format instruction name for SystemVerilog (uppercase with underscores)."""
     # Replace dots with underscores and convert to uppercase
-    return name.replace(".", "_").upper()
+    return name.translate(_SV_NAME_TABLE).upper()
 
 
 def format_csr_name(name):
     """Format CSR name for SystemVerilog (uppercase with underscores)."""
-    return "CSR_" + name.replace(".", "_").upper()
+    return "CSR_" + name.translate(_SV_NAME_TABLE).upper()
 
 
 def format_cause_name(name):
     """Format cause name for SystemVerilog (uppercase with underscores)."""
-    return "CAUSE_" + name.replace(".", "_").upper()
+    return "CAUSE_" + name.translate(_SV_NAME_TABLE).upper()
+
+
+# Wildcard padding for the upper half of compressed (16-bit) encodings
+_COMPRESSED_PAD = "?" * 16
 
 
+@functools.lru_cache(maxsize=None)
 def match_to_sverilog_bits(match_str):
-    """Convert a match string to SystemVerilog bit pattern."""
+    """Convert a match string to SystemVerilog bit pattern.
+
+    Pure in the pattern and memoized; aliases sharing an encoding hit the
+    cache.
+    """
     if not match_str:
         logging.error(f"Empty match string encountered.")
 
@@ -90,71 +104,69 @@ def match_to_sverilog_bits(match_str):
     # with the upper 16 bits as wildcards
     if len(match_str) == 16:
         # Pad with wildcards on the left for 16-bit instructions
-        match_str = "?" * 16 + match_str
+        match_str = _COMPRESSED_PAD + match_str
     elif len(match_str) != 32:
         logging.error(f"Match string length is {len(match_str)}, expected 32 or 16.")
 
     # Convert to SystemVerilog format (0, 1, or ?)
-    result = match_str.replace("-", "?")
-
-    return "32'b" + "".join(result)
+    return "32'b" + match_str.replace("-", "?")
 
 
 def generate_sverilog(instructions, csrs, causes, output_file):
     """Generate SystemVerilog package file."""
+    # Format each name once and reuse it for both the alignment pass and emission
+    instr_names = {name: format_instruction_name(name) for name in instructions}
+    csr_names = {addr: format_csr_name(name) for addr, name in csrs.items()}
+    cause_names = [(num, format_cause_name(name)) for num, name in causes]
+
+    # Assemble the whole file in memory and emit it with one write call
+    parts = [
+        f"/* Automatically generated by UDB */\npackage {Path(output_file).stem};\n"
+    ]
+
+    # Find the maximum name length for alignment
+    max_instr_len = max((len(name) for name in instr_names.values()), default=0)
+    max_csr_len = max((len(name) for name in csr_names.values()), default=0)
+    max_cause_len = max((len(name) for _, name in cause_names), default=0)
+    max_len = max(max_instr_len, max_csr_len)
+
+    # Write instruction parameters
+    for name in sorted(instructions.keys()):
+        encoding = instructions[name]
+        sv_name = instr_names[name]
+        # Pad the name for alignment
+        padded_name = sv_name.ljust(max_len)
+        # Get the match pattern
+        if isinstance(encoding, dict) and "match" in encoding:
+            match = encoding["match"]
+        else:
+            logging.error(f"No match field for instruction {name}.")
+            continue
+
+        sv_bits = match_to_sverilog_bits(match)
+        parts.append(f"  localparam logic [31:0] {padded_name} = {sv_bits};\n")
+
+    # Write CSR parameters
+    # CSRs are returned as {address: name} by load_csrs
+    for addr in sorted(csrs.keys()):
+        sv_name = csr_names[addr]
+        # Pad the name for alignment
+        padded_name = sv_name.ljust(max_len)
+
+        # Format CSR address as 12-bit hex
+        parts.append(f"  localparam logic [11:0] {padded_name} = 12'h{addr:03x};\n")
+
+    # Write exception code parameters
+    for num, sv_name in cause_names:
+        # Pad the name for alignment
+        padded_name = sv_name.ljust(max_cause_len)
+        parts.append(f"  localparam logic [5:0] {padded_name} = 6'h{num:02x};\n")
+
+    # Write footer
+    parts.append("\nendpackage\n")
+
     with open(output_file, "w") as f:
-        # Write header
-        f.write("/* Automatically generated by UDB */\n")
-        f.write(f"package {Path(output_file).stem};\n")
-
-        # Find the maximum name length for alignment
-        max_instr_len = max(
-            (len(format_instruction_name(name)) for name in instructions.keys()),
-            default=0,
-        )
-        max_csr_len = max(
-            (len(format_csr_name(csrs[addr])) for addr in csrs.keys()), default=0
-        )
-        max_cause_len = max(
-            (len(format_cause_name(name)) for _, name in causes), default=0
-        )
-        max_len = max(max_instr_len, max_csr_len)
-
-        # Write instruction parameters
-        for name in sorted(instructions.keys()):
-            encoding = instructions[name]
-            sv_name = format_instruction_name(name)
-            # Pad the name for alignment
-            padded_name = sv_name.ljust(max_len)
-            # Get the match pattern
-            if isinstance(encoding, dict) and "match" in encoding:
-                match = encoding["match"]
-            else:
-                logging.error(f"No match field for instruction {name}.")
-
-            sv_bits = match_to_sverilog_bits(match)
-            f.write(f"  localparam logic [31:0] {padded_name} = {sv_bits};\n")
-
-        # Write CSR parameters
-        # CSRs are returned as {address: name} by load_csrs
-        for addr in sorted(csrs.keys()):
-            csr_name = csrs[addr]
-            sv_name = format_csr_name(csr_name)
-            # Pad the name for alignment
-            padded_name = sv_name.ljust(max_len)
-
-            # Format CSR address as 12-bit hex
-            f.write(f"  localparam logic [11:0] {padded_name} = 12'h{addr:03x};\n")
-
-        # Write exception code parameters
-        for num, name in causes:
-            sv_name = format_cause_name(name)
-            # Pad the name for alignment
-            padded_name = sv_name.ljust(max_cause_len)
-            f.write(f"  localparam logic [5:0] {padded_name} = 6'h{num:02x};\n")
-
-        # Write footer
-        f.write("\nendpackage\n")
+        f.write("".join(parts))
 
 
 def main():
@@ -164,12 +176,15 @@ def main():
     log_level = logging.DEBUG if args.debug else logging.INFO
     logging.basicConfig(level=log_level, format="%(levelname)s:: %(message)s")
 
-    # Parse extensions
+    # Parse extensions; -e takes space-separated values that may themselves
+    # be comma-separated lists
     if args.include_all:
         enabled_extensions = []
         logging.info("Including all instructions and CSRs (ignoring extension filter)")
     else:
-        enabled_extensions = [ext.strip() for ext in args.extensions.split(",")]
+        enabled_extensions = [
+            e.strip() for ext in args.extensions for e in ext.split(",") if e.strip()
+        ]
         logging.info(f"Enabled extensions: {', '.join(enabled_extensions)}")
 
     logging.info(f"Target architecture: {args.arch}")
@@ -187,7 +202,7 @@ def main():
     # Load exception codes
     causes = load_exception_codes(
         args.ext_dir,
-        args.extensions,
+        enabled_extensions,
         include_all=args.include_all,
         resolved_codes_file=args.resolved_codes,
     )
@@ -2,15 +2,32 @@
 # SPDX-FileCopyrightText: 2024-2025 Contributors to the RISCV UnifiedDB <https://github.com/riscv-software-src/riscv-unified-db>
 # SPDX-License-Identifier: BSD-3-Clause-Clear
 
+import functools
 import os
 import re
 import yaml
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import pytest
 
+try:
+    # libyaml C bindings, when present, parse several times faster
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 yaml_instructions = {}
 REPO_DIRECTORY = None
 
+# Precompiled patterns used on the per-instruction comparison hot path
+_JSON_BIT_TOKEN_RE = re.compile(r"(?:[01]|[A-Za-z0-9]+(?:\[\d+\]|\[\?\])?)")
+_VM_TOKEN_RE = re.compile(r"vm\[[^\]]*\]")
+_FIELD_NAME_RE = re.compile(r"([A-Za-z0-9]+)(?:\[\d+\]|\[\?\])?")
+_LOC_RANGE_RE = re.compile(r"(\d+)\s*(?:-\s*(\d+))?")
+
+# Fixed (non-variable) encoding bits
+_FIXED_BITS = frozenset("01")
+
 
 def safe_get(data, key, default=""):
     """Safely get a value from a dictionary, return default if not found or error."""
@@ -65,8 +82,8 @@ def load_inherited_variable(var_path, repo_dir):
             print(f"Warning: Inherited file not found: {full_path}")
             return None
 
-        with open(full_path) as f:
-            data = yaml.safe_load(f)
+        with open(full_path, "rb") as f:
+            data = yaml.load(f, Loader=_YamlLoader)
 
         for key in anchor.split("/"):
             if key in data:
@@ -93,25 +110,19 @@ def resolve_variable_definition(var, repo_dir):
 def parse_location(loc_str):
     """Parse location string that may contain multiple ranges."""
     if not loc_str:
-        return []
-
-    loc_str = str(loc_str).strip()
-    ranges = []
-
-    for range_str in loc_str.split("|"):
-        range_str = range_str.strip()
-        if "-" in range_str:
-            high, low = map(int, range_str.split("-"))
-            ranges.append((high, low))
-        else:
-            try:
-                val = int(range_str)
-                ranges.append((val, val))
-            except ValueError:
-                print(f"Warning: Invalid location format: {range_str}")
-                continue
-
-    return ranges
+        return ()
+    return _parse_location_cached(str(loc_str).strip())
+
+
+@functools.lru_cache(maxsize=None)
+def _parse_location_cached(loc_str):
+    """Parse a normalized location string; the same few strings recur across
+    instructions, so results are memoized. One regex scan extracts every
+    high(-low) range; anything malformed simply contributes no range."""
+    return tuple(
+        (int(high), int(low) if low else int(high))
+        for high, low in _LOC_RANGE_RE.findall(loc_str)
+    )
 
 
 def load_yaml_encoding(instr_name):
@@ -134,8 +145,8 @@ def load_yaml_encoding(instr_name):
     if not yaml_file_path or not os.path.isfile(yaml_file_path):
         return None, None
 
-    with open(yaml_file_path) as yf:
-        ydata = yaml.safe_load(yf)
+    with open(yaml_file_path, "rb") as yf:
+        ydata = yaml.load(yf, Loader=_YamlLoader)
 
     encoding = safe_get(ydata, "encoding", {})
     yaml_match = safe_get(encoding, "match", None)
@@ -176,37 +187,34 @@ def compare_yaml_json_encoding(
         if ranges:
             yaml_var_positions[var["name"]] = ranges
 
-    tokens = re.findall(r"(?:[01]|[A-Za-z0-9]+(?:\[\d+\]|\[\?\])?)", json_encoding_str)
-    json_bits = []
-    bit_index = expected_length - 1
-    for t in tokens:
-        json_bits.append((bit_index, t))
-        bit_index -= 1
-
-    if bit_index != -1:
+    tokens = _JSON_BIT_TOKEN_RE.findall(json_encoding_str)
+    if len(tokens) != expected_length:
         return [
-            f"JSON encoding does not appear to be {expected_length} bits. Ends at bit {bit_index+1}."
+            f"JSON encoding does not appear to be {expected_length} bits. Ends at bit {expected_length - len(tokens)}."
         ]
+    json_bits = [(expected_length - 1 - i, t) for i, t in enumerate(tokens)]
 
     normalized_json_bits = []
     for pos, tt in json_bits:
-        if re.match(r"vm\[[^\]]*\]", tt):
+        if _VM_TOKEN_RE.match(tt):
             tt = "vm"
         normalized_json_bits.append((pos, tt))
     json_bits = normalized_json_bits
 
+    # Look each bit position up once instead of rescanning json_bits per bit
+    bit_tokens = dict(json_bits)
+
     differences = []
 
     for b in range(expected_length):
         yaml_bit = yaml_pattern_str[expected_length - 1 - b]
-        token = [tt for (pos, tt) in json_bits if pos == b]
-        if not token:
+        json_bit_str = bit_tokens.get(b)
+        if json_bit_str is None:
             differences.append(f"Bit {b}: No corresponding JSON bit found.")
             continue
-        json_bit_str = token[0]
 
-        if yaml_bit in ["0", "1"]:
-            if json_bit_str not in ["0", "1"]:
+        if yaml_bit in _FIXED_BITS:
+            if json_bit_str not in _FIXED_BITS:
                 differences.append(
                     f"Bit {b}: YAML expects fixed bit '{yaml_bit}' but JSON has '{json_bit_str}'"
                 )
@@ -215,7 +223,7 @@ def compare_yaml_json_encoding(
                     f"Bit {b}: YAML expects '{yaml_bit}' but JSON has '{json_bit_str}'"
                 )
         else:
-            if json_bit_str in ["0", "1"]:
+            if json_bit_str in _FIXED_BITS:
                 differences.append(
                     f"Bit {b}: YAML variable bit but JSON is fixed '{json_bit_str}'"
                 )
@@ -228,19 +236,9 @@ def compare_yaml_json_encoding(
                 )
                 continue
 
-            json_var_fields = []
-            for bb in range(low, high + 1):
-                token = [tt for (pos, tt) in json_bits if pos == bb]
-                if token:
-                    json_var_fields.append(token[0])
-                else:
-                    json_var_fields.append("?")
-
-            field_names = set(
-                re.findall(
-                    r"([A-Za-z0-9]+)(?:\[\d+\]|\[\?\])?", " ".join(json_var_fields)
-                )
-            )
+            json_var_fields = [bit_tokens.get(bb, "?") for bb in range(low, high + 1)]
+
+            field_names = set(_FIELD_NAME_RE.findall(" ".join(json_var_fields)))
             if len(field_names) == 0:
                 differences.append(
                     f"Variable {var_name}: No corresponding field found in JSON bits {high}-{low}"
@@ -253,26 +251,50 @@ def compare_yaml_json_encoding(
     return differences
 
 
+def _iter_yaml_entries(root_dir, rel_dir="."):
+    """Yield (relative_dir, filename) for every .yaml file under root_dir.
+
+    Walks with os.scandir so the file-vs-directory checks reuse readdir
+    metadata instead of stat-ing every entry, and the relative directory is
+    built once per directory instead of once per file.
+    """
+    try:
+        entries = os.scandir(root_dir)
+    except OSError:
+        return
+    with entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                sub = (
+                    entry.name if rel_dir == "." else os.path.join(rel_dir, entry.name)
+                )
+                yield from _iter_yaml_entries(entry.path, sub)
+            elif entry.name.endswith(".yaml"):
+                yield rel_dir, entry.name
+
+
 def get_yaml_instructions(repo_directory):
     """Recursively find all YAML files in the repository and load their encodings."""
     global yaml_instructions, REPO_DIRECTORY
     REPO_DIRECTORY = repo_directory
     yaml_instructions = {}
 
-    for root, _, files in os.walk(repo_directory):
-        for file in files:
-            if file.endswith(".yaml"):
-                instr_name = os.path.splitext(file)[0]
-                relative_path = os.path.relpath(root, repo_directory)
-                yaml_instructions[instr_name.lower()] = relative_path
+    for relative_path, file in _iter_yaml_entries(repo_directory):
+        instr_name = os.path.splitext(file)[0]
+        yaml_instructions[instr_name.lower()] = relative_path
 
+    # Load the per-instruction YAML files on a thread pool so file reads
+    # overlap instead of serializing one open/parse per instruction
     instructions_with_encodings = {}
-    for instr_name_lower, path in yaml_instructions.items():
-        yaml_match, yaml_vars = load_yaml_encoding(instr_name_lower)
-        instructions_with_encodings[instr_name_lower] = {
-            "category": path,
-            "yaml_match": yaml_match,
-            "yaml_vars": yaml_vars,
-        }
+    with ThreadPoolExecutor() as pool:
+        encodings = pool.map(load_yaml_encoding, yaml_instructions)
+        for (instr_name_lower, path), (yaml_match, yaml_vars) in zip(
+            yaml_instructions.items(), encodings
+        ):
+            instructions_with_encodings[instr_name_lower] = {
+                "category": path,
+                "yaml_match": yaml_match,
+                "yaml_vars": yaml_vars,
+            }
 
     return instructions_with_encodings
@@ -38,11 +38,14 @@ def load_test_data():
     return _yaml_instructions, _json_data, _repo_dir
 
 
+_AQRL_NAMES = frozenset({"aq", "rl"})
+
+
 def has_aqrl_variables(yaml_vars):
     """Check if instruction has aq/rl variables."""
     if not yaml_vars:
         return False
-    return any(var.get("name") in ["aq", "rl"] for var in yaml_vars)
+    return any(var.get("name") in _AQRL_NAMES for var in yaml_vars)
 
 
 def pytest_generate_tests(metafunc):
@@ -61,21 +64,19 @@ class TestInstructionEncoding:
             "RVInstCommon", []
         )
 
-    def _find_matching_instruction(self, yaml_instr_name):
-        """Find matching instruction in JSON data by comparing instruction names."""
-        yaml_instr_name = yaml_instr_name.lower().strip()
-
-        for def_name in self.rv_instructions:
-            value = self.json_data.get(def_name)
+        # Index JSON instructions by base assembly mnemonic once so each test
+        # does a dict lookup instead of rescanning every definition; keep the
+        # first definition per mnemonic to match the old scan order
+        cls.asm_name_index = {}
+        for def_name in cls.rv_instructions:
+            value = cls.json_data.get(def_name)
             if not isinstance(value, dict):
                 continue
 
-            is_pseudo = value.get("isPseudo", "")
-            if is_pseudo == 1:
+            if value.get("isPseudo", "") == 1:
                 continue
 
-            is_codegen_only = value.get("isCodeGenOnly", "")
-            if is_codegen_only == 1:
+            if value.get("isCodeGenOnly", "") == 1:
                 continue
 
             asm_string = value.get("AsmString", "").lower().strip()
@@ -83,10 +84,11 @@ class TestInstructionEncoding:
                 continue
 
             base_asm_name = asm_string.split()[0]
-            if base_asm_name == yaml_instr_name:
-                return def_name
+            cls.asm_name_index.setdefault(base_asm_name, def_name)
 
-        return None
+    def _find_matching_instruction(self, yaml_instr_name):
+        """Find matching instruction in JSON data by comparing instruction names."""
+        return self.asm_name_index.get(yaml_instr_name.lower().strip())
 
     def _get_json_encoding(self, json_instr):
         """Extract encoding string from JSON instruction data."""
@@ -149,15 +151,16 @@ class TestInstructionEncoding:
         if differences and differences != [
             "No YAML match field available for comparison."
         ]:
-            error_msg = f"\nEncoding mismatch for instruction: {instr_name}\n"
-            error_msg += f"name : {instr_name}\n"
-            error_msg += f"JSON key: {json_key}\n"
-            error_msg += f"YAML match: {yaml_data['yaml_match']}\n"
-            error_msg += f"JSON encoding: {json_encoding}\n"
-            error_msg += "Differences:\n"
-            for diff in differences:
-                error_msg += f"  - {diff}\n"
-            pytest.fail(error_msg)
+            difference_lines = "".join(f"  - {diff}\n" for diff in differences)
+            pytest.fail(
+                f"\nEncoding mismatch for instruction: {instr_name}\n"
+                f"name : {instr_name}\n"
+                f"JSON key: {json_key}\n"
+                f"YAML match: {yaml_data['yaml_match']}\n"
+                f"JSON encoding: {json_encoding}\n"
+                "Differences:\n"
+                f"{difference_lines}"
+            )
 
 
 def pytest_configure(config):
@@ -24,6 +24,8 @@ Enhanced features:
 import asyncio
 import json
 import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Set
 import yaml
@@ -39,6 +41,8 @@ from mcp.types import Tool, TextContent
 
 REPO_ROOT = Path(__file__).resolve().parents[2]
 GEN_DIR = REPO_ROOT / "gen"
+# Resolved once; _ensure_in_gen compares against this on every read request
+_GEN_DIR_RESOLVED_STR = str(GEN_DIR.resolve())
 
 
 # ============================================================================
@@ -93,6 +97,12 @@ def _fuzzy_match(query: str, target: str, threshold: float = 0.6) -> bool:
     if max_len == 0:
         return True
 
+    # The distance is at least the length difference, so the similarity is
+    # bounded above by this — reject before the O(n*m) computation when the
+    # bound already falls under the threshold
+    if 1.0 - (abs(len(query_lower) - len(target_lower)) / max_len) < threshold:
+        return False
+
     distance = _levenshtein_distance(query_lower, target_lower)
     similarity = 1.0 - (distance / max_len)
 
@@ -131,7 +141,7 @@ def _fuzzy_score(query: str, target: str) -> float:
 def _ensure_in_gen(path: Path) -> Path:
     """Validate path is inside gen/ and is a YAML file."""
     p = (REPO_ROOT / path).resolve()
-    if not str(p).startswith(str(GEN_DIR.resolve())):
+    if not str(p).startswith(_GEN_DIR_RESOLVED_STR):
         raise ValueError("Path must be inside 'gen/'")
     if p.suffix.lower() not in {".yaml", ".yml"}:
         raise ValueError("Path must end with .yaml or .yml")
@@ -140,31 +150,53 @@ def _ensure_in_gen(path: Path) -> Path:
     return p
 
 
+# Parsed YAML keyed by path with its (mtime_ns, size) stamp; searches walk
+# the same gen/ tree on every tool call, so warm calls skip re-parsing
+_yaml_cache: dict[str, tuple[tuple[int, int], dict]] = {}
+
+
 def _load_yaml(path: Path) -> dict:
-    """Load and parse a YAML file."""
+    """Load and parse a YAML file (cached until the file changes on disk)."""
+    key = str(path)
+    st = os.stat(path)
+    stamp = (st.st_mtime_ns, st.st_size)
+    cached = _yaml_cache.get(key)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
     with open(path, encoding="utf-8") as fh:
-        return yaml.safe_load(fh) or {}
+        data = yaml.safe_load(fh) or {}
+    _yaml_cache[key] = (stamp, data)
+    return data
 
 
 def _extract_defined_by(data: dict) -> List[str]:
-    """Extract extension names from definedBy field (handles string, list, dict with anyOf/allOf)."""
+    """Extract extension names from definedBy field (handles string, list, dict with anyOf/allOf).
+
+    Names are sys.intern'd: the same few short strings recur across thousands
+    of files, so interning makes set membership a pointer compare and shares
+    one string object per name.
+    """
     defined = data.get("definedBy")
     if defined is None:
         return []
     if isinstance(defined, str):
-        return [defined]
+        return [sys.intern(defined)]
     if isinstance(defined, list):
-        return [str(x) for x in defined]
+        return [sys.intern(str(x)) for x in defined]
     if isinstance(defined, dict):
         # handle anyOf / allOf patterns
         for k in ("anyOf", "allOf", "oneOf"):
             if k in defined and isinstance(defined[k], list):
-                return [str(x) for x in defined[k]]
+                return [sys.intern(str(x)) for x in defined[k]]
     return []
 
 
-def _extension_in_path(rel_parts: List[str]) -> Optional[str]:
-    """Find extension name from path (heuristic: segment after 'inst')."""
+def _extension_in_path(rel_parts) -> Optional[str]:
+    """Find extension name from path (heuristic: segment after 'inst').
+
+    Accepts any sequence of path segments, so callers can pass Path.parts
+    tuples directly without copying them into a list per file.
+    """
     for i, part in enumerate(rel_parts):
         if part == "inst" and i + 1 < len(rel_parts):
             return rel_parts[i + 1]
@@ -176,18 +208,18 @@ def _csr_extensions(data: dict) -> set[str]:
     exts: set[str] = set()
     top = data.get("definedBy")
     if isinstance(top, str):
-        exts.add(top)
+        exts.add(sys.intern(top))
     elif isinstance(top, list):
-        exts.update(str(x) for x in top)
+        exts.update(sys.intern(str(x)) for x in top)
     fields = data.get("fields")
     if isinstance(fields, dict):
         for fld in fields.values():
             if isinstance(fld, dict) and "definedBy" in fld:
                 db = fld.get("definedBy")
                 if isinstance(db, str):
-                    exts.add(db)
+                    exts.add(sys.intern(db))
                 elif isinstance(db, list):
-                    exts.update(str(x) for x in db)
+                    exts.update(sys.intern(str(x)) for x in db)
     return exts
 
 
@@ -217,9 +249,11 @@ def _extract_xlen(data: dict) -> Set[int]:
     indicators = defined_by + [name]
     for indicator in indicators:
         s = str(indicator).upper()
-        if "RV32" in s or "32" in s:
+        # "32" in s already covers "RV32" (and likewise for 64), so one
+        # substring scan per width is enough
+        if "32" in s:
             xlens.add(32)
-        if "RV64" in s or "64" in s:
+        if "64" in s:
             xlens.add(64)
 
     # Check encoding for base-specific patterns
@@ -294,15 +328,16 @@ def _iter_instruction_yaml_paths() -> List[Path]:
         # Only consider instruction folders
         if "inst" not in root_p.parts:
             continue
+        # Must be under spec/*/inst or resolved_spec/*/inst; this only
+        # depends on the directory, so check it once instead of per file
+        if not any(
+            part in {"spec", "resolved_spec"}
+            for part in root_p.relative_to(GEN_DIR).parts
+        ):
+            continue
         for f in files:
             if f.lower().endswith((".yaml", ".yml")):
-                p = root_p / f
-                # Must be under spec/*/inst or resolved_spec/*/inst
-                if any(
-                    part in {"spec", "resolved_spec"}
-                    for part in p.relative_to(GEN_DIR).parts
-                ):
-                    paths.append(p)
+                paths.append(root_p / f)
     return paths
 
 
@@ -434,6 +469,8 @@ async def search_instructions(args: Dict[str, Any]):
         except re.error as e:
             raise ValueError(f"Invalid regex pattern: {e}")
 
+    term_lower = term.lower() if term else None
+
     for p in _iter_instruction_yaml_paths():
         rel = p.relative_to(REPO_ROOT)
         rel_str = str(rel)
@@ -456,29 +493,29 @@ async def search_instructions(args: Dict[str, Any]):
         # General term filter
         elif term:
             namepart = p.stem.lower()
-            target_str = rel_str.lower()
-
-            # Also include instruction name and assembly in search
-            inst_name = data.get("name", "")
-            assembly = data.get("assembly", "")
-            long_name = data.get("long_name", "")
-            search_text = (
-                f"{namepart} {target_str} {inst_name} {assembly} {long_name}".lower()
-            )
-
-            matched = False
 
-            if regex_pattern:
-                matched = bool(regex_pattern.search(search_text))
-            elif fuzzy:
+            if not regex_pattern and fuzzy:
+                # Fuzzy matching scores individual fields, so skip building
+                # the concatenated search text on this branch
                 threshold = float(fuzzy) if isinstance(fuzzy, (int, float)) else 0.6
                 matched = (
-                    _fuzzy_match(term, inst_name, threshold)
-                    or _fuzzy_match(term, assembly, threshold)
+                    _fuzzy_match(term, data.get("name", ""), threshold)
+                    or _fuzzy_match(term, data.get("assembly", ""), threshold)
                     or _fuzzy_match(term, namepart, threshold)
                 )
             else:
-                matched = term.lower() in search_text
+                # Also include instruction name and assembly in search
+                inst_name = data.get("name", "")
+                assembly = data.get("assembly", "")
+                long_name = data.get("long_name", "")
+                search_text = (
+                    f"{namepart} {rel_str.lower()} {inst_name} {assembly} {long_name}"
+                ).lower()
+
+                if regex_pattern:
+                    matched = bool(regex_pattern.search(search_text))
+                else:
+                    matched = term_lower in search_text
 
             if not matched:
                 continue
@@ -496,12 +533,12 @@ async def search_instructions(args: Dict[str, Any]):
             if present.isdisjoint(ext_set):
                 continue
 
-        # XLEN filter
-        if xlen_set:
-            inst_xlens = _extract_xlen(data)
-            if inst_xlens.isdisjoint(xlen_set):
-                continue
+        # XLEN filter (the extraction result is reused for the info dict below)
+        inst_xlens = _extract_xlen(data)
+        if xlen_set and inst_xlens.isdisjoint(xlen_set):
+            continue
 
+        encoding = data.get("encoding")
         info = {
             "path": rel_str,
             "kind": data.get("kind"),
@@ -509,13 +546,11 @@ async def search_instructions(args: Dict[str, Any]):
             "long_name": data.get("long_name"),
             "assembly": data.get("assembly"),
             "encoding": (
-                {"match": data.get("encoding", {}).get("match")}
-                if isinstance(data.get("encoding"), dict)
-                else None
+                {"match": encoding.get("match")} if isinstance(encoding, dict) else None
             ),
             "definedBy": defined_by,
             "extensionInPath": ext_from_path,
-            "xlen": list(_extract_xlen(data)),
+            "xlen": list(inst_xlens),
         }
 
         # Add fuzzy score if fuzzy matching was used
@@ -614,6 +649,8 @@ async def search_csrs(args: Dict[str, Any]):
         except re.error as e:
             raise ValueError(f"Invalid regex pattern: {e}")
 
+    term_lower = term.lower() if term else None
+
     for p in _iter_csr_yaml_paths():
         rel = str(p.relative_to(REPO_ROOT))
 
@@ -635,23 +672,27 @@ async def search_csrs(args: Dict[str, Any]):
         # General term filter
         elif term:
             namepart = p.stem.lower()
-            csr_name = data.get("name", "")
-            long_name = data.get("long_name", "")
-            search_text = f"{namepart} {rel.lower()} {csr_name} {long_name}".lower()
 
-            matched = False
-
-            if regex_pattern:
-                matched = bool(regex_pattern.search(search_text))
-            elif fuzzy:
+            if not regex_pattern and fuzzy:
+                # Fuzzy matching scores individual fields, so skip building
+                # the concatenated search text on this branch
                 threshold = float(fuzzy) if isinstance(fuzzy, (int, float)) else 0.6
                 matched = (
-                    _fuzzy_match(term, csr_name, threshold)
-                    or _fuzzy_match(term, long_name, threshold)
+                    _fuzzy_match(term, data.get("name", ""), threshold)
+                    or _fuzzy_match(term, data.get("long_name", ""), threshold)
                     or _fuzzy_match(term, namepart, threshold)
                 )
             else:
-                matched = term.lower() in search_text
+                csr_name = data.get("name", "")
+                long_name = data.get("long_name", "")
+                search_text = (
+                    f"{namepart} {rel.lower()} {csr_name} {long_name}"
+                ).lower()
+
+                if regex_pattern:
+                    matched = bool(regex_pattern.search(search_text))
+                else:
+                    matched = term_lower in search_text
 
             if not matched:
                 continue
@@ -662,11 +703,10 @@ async def search_csrs(args: Dict[str, Any]):
         if ext_set and csr_exts.isdisjoint(ext_set):
             continue
 
-        # XLEN filter
-        if xlen_set:
-            csr_xlens = _extract_xlen(data)
-            if csr_xlens.isdisjoint(xlen_set):
-                continue
+        # XLEN filter (the extraction result is reused for the info dict below)
+        csr_xlens = _extract_xlen(data)
+        if xlen_set and csr_xlens.isdisjoint(xlen_set):
+            continue
 
         info = {
             "path": rel,
@@ -676,7 +716,7 @@ async def search_csrs(args: Dict[str, Any]):
             "address": data.get("address"),
             "priv_mode": data.get("priv_mode"),
             "definedBy": list(csr_exts),
-            "xlen": list(_extract_xlen(data)),
+            "xlen": list(csr_xlens),
         }
 
         # Add fuzzy score if fuzzy matching was used
@@ -795,6 +835,10 @@ async def search_all(args: Dict[str, Any]):
             except re.error:
                 pass
 
+        # These don't vary per file, so compute them once outside the loop
+        term_lower = term.lower()
+        threshold = float(fuzzy) if isinstance(fuzzy, (int, float)) else 0.6
+
         for p in _iter_extension_yaml_paths():
             try:
                 data = _load_yaml(p)
@@ -809,12 +853,11 @@ async def search_all(args: Dict[str, Any]):
                 if regex_pattern:
                     matched = bool(regex_pattern.search(search_text))
                 elif fuzzy:
-                    threshold = float(fuzzy) if isinstance(fuzzy, (int, float)) else 0.6
                     matched = _fuzzy_match(term, name, threshold) or _fuzzy_match(
                         term, long_name, threshold
                     )
                 else:
-                    matched = term.lower() in search_text
+                    matched = term_lower in search_text
 
                 if matched:
                     info = {
@@ -882,29 +925,32 @@ async def search_extensions(args: Dict[str, Any]):
     include_csrs = args.get("include_csrs", False)
     limit = int(args.get("limit") or 100)
 
-    # Collect all extensions
-    items: list[dict[str, Any]] = []
-    for p in _iter_extension_yaml_paths():
+    # Collect all extensions, de-duping by name (favor shortest path) in the
+    # same pass instead of building an intermediate list and re-walking it.
+    # The listing always reads every extension YAML, so the file loads run
+    # on a thread pool to overlap the IO.
+    def _try_load(path: Path):
         try:
-            data = _load_yaml(p)
+            return path, _load_yaml(path)
         except Exception:
+            return path, None
+
+    by_name: dict[str, dict[str, Any]] = {}
+    with ThreadPoolExecutor() as pool:
+        loaded = list(pool.map(_try_load, _iter_extension_yaml_paths()))
+    for p, data in loaded:
+        if data is None:
             continue
         if data.get("kind") == "extension" and isinstance(data.get("name"), str):
-            items.append(
-                {
-                    "path": str(p.relative_to(REPO_ROOT)),
-                    "name": data.get("name"),
+            n = data.get("name")
+            path_str = str(p.relative_to(REPO_ROOT))
+            if n not in by_name or len(path_str) < len(by_name[n]["path"]):
+                by_name[n] = {
+                    "path": path_str,
+                    "name": n,
                     "long_name": data.get("long_name"),
                     "data": data,  # Keep full data for detail view
                 }
-            )
-
-    # De-dup by name, favor shortest path
-    by_name: dict[str, dict[str, Any]] = {}
-    for it in items:
-        n = it["name"]
-        if n not in by_name or len(it["path"]) < len(by_name[n]["path"]):
-            by_name[n] = it
 
     # List all extensions if no specific name
     if not name:
@@ -939,16 +985,17 @@ async def search_extensions(args: Dict[str, Any]):
                 if str(p).startswith(str(GEN_DIR))
                 else p.parts
             )
-            ext_from_path = _extension_in_path(list(rel_parts))
+            ext_from_path = _extension_in_path(rel_parts)
             if name in defined_by or (ext_from_path == name):
+                encoding = data.get("encoding")
                 insts.append(
                     {
                         "path": str(p.relative_to(REPO_ROOT)),
                         "name": data.get("name"),
                         "assembly": data.get("assembly"),
                         "encoding": (
-                            data.get("encoding", {}).get("match")
-                            if isinstance(data.get("encoding"), dict)
+                            encoding.get("match")
+                            if isinstance(encoding, dict)
                             else None
                         ),
                     }
@@ -987,8 +1034,21 @@ async def search_extensions(args: Dict[str, Any]):
 # ============================================================================
 
 
+# Precompiled patterns for the function-doc parsers, which run per line /
+# per call on the doc files
+_BACKTICK_NAME_RE = re.compile(r"`([^`]+)\`?")
+_SECTION_HEADING_RE = re.compile(r"^==\s+", flags=re.M)
+
+_funcs_adoc_cache: tuple[Path, Path] | None = None
+
+
 def _find_funcs_adoc() -> tuple[Path | None, Path | None]:
     """Locate function documentation files."""
+    global _funcs_adoc_cache
+    # Skip the doc-tree walk entirely once both files have been located;
+    # partial results are not cached so the docs can still appear later
+    if _funcs_adoc_cache is not None:
+        return _funcs_adoc_cache
     funcs_doc = None
     all_funcs = None
     cfg_root = GEN_DIR / "cfg_html_doc"
@@ -1009,6 +1069,8 @@ def _find_funcs_adoc() -> tuple[Path | None, Path | None]:
             cand_all = root_p / "all_funcs.adoc"
             if cand_all.exists():
                 all_funcs = cand_all
+    if funcs_doc is not None and all_funcs is not None:
+        _funcs_adoc_cache = (funcs_doc, all_funcs)
     return funcs_doc, all_funcs
 
 
@@ -1021,7 +1083,7 @@ def _parse_all_funcs_names(all_funcs_path: Path) -> list[str]:
                 line = line.strip()
                 if line.startswith("* ") and "`" in line:
                     # format: * `name`
-                    back = re.findall(r"`([^`]+)\`?", line)
+                    back = _BACKTICK_NAME_RE.findall(line)
                     if back:
                         names.append(back[0])
     except Exception:
@@ -1029,14 +1091,24 @@ def _parse_all_funcs_names(all_funcs_path: Path) -> list[str]:
     return names
 
 
+_funcs_sections_cache: dict[tuple[str, int], dict[str, str]] = {}
+
+
 def _parse_funcs_sections(funcs_path: Path) -> dict[str, str]:
-    """Parse function documentation sections."""
+    """Parse function documentation sections (cached by path and mtime)."""
+    try:
+        cache_key = (str(funcs_path), os.stat(funcs_path).st_mtime_ns)
+        cached = _funcs_sections_cache.get(cache_key)
+        if cached is not None:
+            return cached
+    except OSError:
+        cache_key = None
     sections: dict[str, str] = {}
     try:
         with open(funcs_path, encoding="utf-8") as fh:
             content = fh.read()
         # Split on level 2 headings "== name" (start of line)
-        parts = re.split(r"^==\s+", content, flags=re.M)
+        parts = _SECTION_HEADING_RE.split(content)
         # parts[0] is preamble; subsequent parts are "Name\n<body>"
         for part in parts[1:]:
             lines = part.splitlines()
@@ -1048,6 +1120,8 @@ def _parse_funcs_sections(funcs_path: Path) -> dict[str, str]:
             sections[name] = body
     except Exception:
         pass
+    if cache_key is not None:
+        _funcs_sections_cache[cache_key] = sections
     return sections
 
 
@@ -1132,9 +1206,10 @@ async def find_function_usages(args: Dict[str, Any]):
 
         for key in ("operation()", "sail()"):
             val = data.get(key)
-            if isinstance(val, str) and (name in val):
+            # A single find() both tests for and locates the occurrence
+            idx = val.find(name) if isinstance(val, str) else -1
+            if idx != -1:
                 # Extract snippet around first occurrence
-                idx = val.find(name)
                 snippet = val[max(0, idx - 60) : idx + 120]
                 hits.append(
                     {
@@ -24,10 +24,10 @@ def main():
     parser.add_argument("paths", nargs="*", default=".")
     params = parser.parse_args()
 
-    profiles_filter = []
+    # A set makes the per-profile membership test O(1)
+    profiles_filter = set()
     if params.profiles is not None:
-        for profile in params.profiles.split(","):
-            profiles_filter.append(profile)
+        profiles_filter = set(params.profiles.split(","))
 
     profiles = []
     for path in params.paths:
@@ -35,7 +35,7 @@ def main():
 
     for profile in sorted(profiles, key=lambda x: x["name"]):
         if (
-            len(profiles_filter) == 0 or profile["name"] in profiles_filter
+            not profiles_filter or profile["name"] in profiles_filter
         ) and "extensions" in profile:
             print(f"{profile['name']}:")
             if "$child_of" in profile["extensions"]:
@@ -45,9 +45,9 @@ def main():
 
             # convert extensions from dict to array to facilitate sorting by closure
             extensions = []
-            for extension in profile["extensions"]:
-                profile["extensions"][extension]["name"] = extension
-                extensions.append(profile["extensions"][extension])
+            for extension_name, extension in profile["extensions"].items():
+                extension["name"] = extension_name
+                extensions.append(extension)
 
             for extension in sorted(
                 extensions, key=lambda x: f"{x['presence']},{x['name']}"
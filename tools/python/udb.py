@@ -1,11 +1,63 @@
 #!/usr/bin/env python3
 # Copyright (c) Ventana Micro Systems
 # SPDX-License-Identifier: BSD-3-Clause-Clear
-"""Python utilities for using UDB"""
+"""Python utilities for using UDB.
 
+YAML parsing prefers PyYAML's libyaml C bindings when available; install
+PyYAML with the C extension for a large speedup on big trees.
+"""
+
+import functools
+import os
+import pickle
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 import yaml
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+
+# Directories that never hold UDB YAML
+_PRUNE_DIRS = frozenset({"__pycache__", "schemas"})
+
+
+def _iter_yaml_files(root_dir):
+    """Yield every .yaml file under root_dir as a Path.
+
+    Walks with os.scandir so the file-vs-directory checks reuse readdir
+    metadata instead of stat-ing each entry; hidden entries and known
+    non-YAML directories are pruned.
+    """
+    try:
+        entries = os.scandir(root_dir)
+    except OSError:
+        return
+    with entries:
+        for entry in entries:
+            if entry.name.startswith("."):
+                continue
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name not in _PRUNE_DIRS:
+                    yield from _iter_yaml_files(entry.path)
+            elif entry.name.endswith(".yaml"):
+                yield Path(entry.path)
+
+
+def _parse_one_yaml(file, kind_markers=None):
+    """Parse a single YAML file (top-level so a process pool can pickle it).
+
+    When kind markers are given, files whose leading bytes match none of
+    them are rejected without running the parser at all.
+    """
+    with open(file, "rb") as f:
+        contents = f.read()
+    if kind_markers and not any(m in contents[:2048] for m in kind_markers):
+        return file, None
+    return file, yaml.load(contents, Loader=_YamlLoader)
+
 
 def find_and_load_yaml(path, kinds=None):
     """Load the YAML files in a directory hierarchy into an array of dictionaries.
@@ -14,12 +66,56 @@ def find_and_load_yaml(path, kinds=None):
     """
     database = []
 
-    p = Path(path)
-    for file in p.rglob("*.yaml"):
-        with open(file, encoding="utf-8") as f:
-            y = yaml.safe_load(f)
-            if "kind" in y:
-                if len(kinds) == 0 or y["kind"] in kinds:
-                    y["file"] = file
-                    database.append(y)
+    files = sorted(_iter_yaml_files(path))
+
+    # Parsed documents are cached in a pickle sidecar keyed by every file's
+    # (mtime_ns, size), so unchanged trees skip the parsers on warm runs
+    signature = {}
+    for file in files:
+        st = file.stat()
+        signature[str(file)] = (st.st_mtime_ns, st.st_size)
+
+    # The kind filter now runs before parsing (a cheap byte scan), so the
+    # cached documents depend on it and the cache records which filter
+    # produced them
+    kinds_key = sorted(kinds) if kinds else None
+    kind_markers = tuple(f"kind: {kind}".encode() for kind in kinds) if kinds else None
+
+    cache_file = Path(path) / ".udb_find_cache.pkl"
+    results = None
+    try:
+        with open(cache_file, "rb") as f:
+            cached = pickle.load(f)
+        if cached.get("signature") == signature and cached.get("kinds") == kinds_key:
+            results = cached["docs"]
+    except Exception:
+        pass
+
+    if results is None:
+        # Parsing is independent per file; fan out on big trees, stay serial
+        # on small ones where pool startup would dominate
+        parse = functools.partial(_parse_one_yaml, kind_markers=kind_markers)
+        if len(files) < 50:
+            results = list(map(parse, files))
+        else:
+            with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+                results = list(executor.map(parse, files, chunksize=64))
+
+        try:
+            tmp_file = cache_file.with_suffix(".pkl.tmp")
+            with open(tmp_file, "wb") as f:
+                pickle.dump(
+                    {"signature": signature, "kinds": kinds_key, "docs": results},
+                    f,
+                    protocol=pickle.HIGHEST_PROTOCOL,
+                )
+            os.replace(tmp_file, cache_file)
+        except OSError:
+            pass
+
+    for file, y in results:
+        if isinstance(y, dict) and "kind" in y:
+            if not kinds or y["kind"] in kinds:
+                y["file"] = file
+                database.append(y)
     return database
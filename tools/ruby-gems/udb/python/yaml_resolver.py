@@ -1,7 +1,8 @@
 # Copyright (c) Qualcomm Technologies, Inc. and/or its subsidiaries.
 # SPDX-License-Identifier: BSD-3-Clause-Clear
 
-import glob, os
+import functools
+import os
 import argparse
 import shutil
 import json
@@ -35,7 +36,43 @@ UDB_ROOT = (
 SCHEMAS_PATH = Path(os.path.join(UDB_ROOT, "spec", "schemas"))
 
 
+def _iter_yaml_files(root_dir: str | Path, min_depth: int = 1):
+    """Yield every .yaml file under root_dir as a path relative to root_dir
+
+    Walks with os.scandir so paths stream out as directories are read,
+    instead of materializing the whole list through glob. Files shallower
+    than min_depth directories are skipped (glob's '*/**/*.yaml' behavior).
+
+    Parameters
+    ----------
+    root_dir : str, Path
+      Directory to walk; missing directories yield nothing
+    min_depth : int
+      Minimum depth, in path components relative to root_dir, of yielded files
+    """
+
+    def walk(abs_dir, rel_dir, depth):
+        try:
+            entries = os.scandir(abs_dir)
+        except FileNotFoundError:
+            return
+        with entries:
+            for entry in entries:
+                if entry.name.startswith("."):
+                    continue
+                rel = os.path.join(rel_dir, entry.name) if rel_dir else entry.name
+                if entry.is_dir():
+                    yield from walk(entry.path, rel, depth + 1)
+                elif depth >= min_depth and entry.name.endswith(".yaml"):
+                    yield rel
+
+    yield from walk(str(root_dir), "", 1)
+
+
+@functools.lru_cache(maxsize=None)
 def retrieve_from_filesystem(uri: str):
+    # Pure in uri; memoized so each referenced schema is read and parsed
+    # once instead of on every validation that references it
     path = SCHEMAS_PATH / Path(uri)
     contents = json.loads(path.read_text())
     return Resource.from_contents(contents)
@@ -173,9 +210,10 @@ def write_yaml(file_path: str | Path, data):
     data : dict, list
       The object to write as YAML
     """
-    with open(file_path, "w") as file:
+    # ruamel emits many small chunks; a large buffer turns them into one
+    # write syscall for typical files
+    with open(file_path, "w", buffering=1 << 20) as file:
         yaml.dump(data, file)
-        file.close()
 
 
 def write_json(file_path: str | Path, data):
@@ -188,9 +226,8 @@ def write_json(file_path: str | Path, data):
     data : dict, list
       The object to write as JSON
     """
-    with open(file_path, "w") as file:
+    with open(file_path, "w", buffering=1 << 20) as file:
         json.dump(data, file)
-        file.close()
 
 
 def dig(obj: dict, *keys):
@@ -618,29 +655,31 @@ if __name__ == "__main__":
     args = cmdparser.parse_args()
 
     if args.command == "merge":
-        arch_paths = glob.glob(f"**/*.yaml", recursive=True, root_dir=args.arch_dir)
+        arch_paths = list(_iter_yaml_files(args.arch_dir))
         if args.overlay_dir != None:
-            overlay_paths = glob.glob(
-                f"**/*.yaml", recursive=True, root_dir=args.overlay_dir
-            )
+            overlay_paths = list(_iter_yaml_files(args.overlay_dir))
             arch_paths.extend(overlay_paths)
             arch_paths = list(set(arch_paths))
-        merged_paths = glob.glob(f"**/*.yaml", recursive=True, root_dir=args.merged_dir)
+        merged_paths = list(_iter_yaml_files(args.merged_dir))
         arch_paths.extend(merged_paths)
         arch_paths = list(set(arch_paths))
 
+        # Create every output directory in one pre-pass; each directory holds
+        # many files, so per-file makedirs calls are mostly redundant stats
+        merged_base = (
+            args.merged_dir
+            if os.path.isabs(args.merged_dir)
+            else os.path.join(args.udb_root, args.merged_dir)
+        )
+        for d in {os.path.dirname(os.path.join(merged_base, p)) for p in arch_paths}:
+            os.makedirs(d, exist_ok=True)
+
         for arch_path in tqdm(
             arch_paths,
             ascii=True,
             desc="Merging arch",
             file=sys.stderr,
         ):
-            merged_arch_path = (
-                os.path.join(args.merged_dir, arch_path)
-                if os.path.isabs(args.merged_dir)
-                else os.path.join(args.udb_root, args.merged_dir, arch_path)
-            )
-            os.makedirs(os.path.dirname(merged_arch_path), exist_ok=True)
             merge_file(arch_path, args.arch_dir, args.overlay_dir, args.merged_dir)
 
         print(
@@ -649,11 +688,9 @@ if __name__ == "__main__":
         )
 
     elif args.command == "resolve":
-        arch_paths = glob.glob(f"*/**/*.yaml", recursive=True, root_dir=args.arch_dir)
+        arch_paths = list(_iter_yaml_files(args.arch_dir, min_depth=2))
         if os.path.exists(args.resolved_dir):
-            resolved_paths = glob.glob(
-                f"*/**/*.yaml", recursive=True, root_dir=args.resolved_dir
-            )
+            resolved_paths = list(_iter_yaml_files(args.resolved_dir, min_depth=2))
             arch_paths.extend(resolved_paths)
             arch_paths = list(set(arch_paths))
         iter = (
@@ -671,9 +708,11 @@ if __name__ == "__main__":
             if not os.path.isabs(args.resolved_dir)
             else f"{args.resolved_dir}"
         )
+        # Create every output directory in one pre-pass instead of calling
+        # makedirs once per file
+        for d in {os.path.dirname(f"{abs_resolved_dir}/{p}") for p in arch_paths}:
+            os.makedirs(d, exist_ok=True)
         for arch_path in iter:
-            resolved_arch_path = f"{abs_resolved_dir}/{arch_path}"
-            os.makedirs(os.path.dirname(resolved_arch_path), exist_ok=True)
             resolve_file(
                 arch_path, args.arch_dir, args.resolved_dir, not args.no_checks
             )